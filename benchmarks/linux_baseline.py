@@ -1,34 +1,84 @@
 #!/usr/bin/env python3
+import http.client
 import json
 import os
 import platform
-import socket
 import threading
 import time
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
 
 RESULT_PATH = os.path.join(os.path.dirname(__file__), "linux_baseline.json")
 
+_compute_kernel = None
+
+def _load_compute_kernel():
+    # Lazy so the module still imports (and falls back to pure Python)
+    # when numba/numpy are not installed.
+    global _compute_kernel
+    if _compute_kernel is None:
+        import numpy as np
+        from numba import njit
+
+        # Explicit signature: compiled at decoration time (no first-call
+        # type inference) and the cached binary is reused across runs.
+        @njit("uint64(int64, uint64)", cache=True, boundscheck=False)
+        def kernel(iters, seed):
+            s = np.uint64(seed)
+            acc = np.uint64(0)
+            k13 = np.uint64(13)
+            k7 = np.uint64(7)
+            k17 = np.uint64(17)
+            for i in range(iters):
+                s ^= s << k13
+                s ^= s >> k7
+                s ^= s << k17
+                acc ^= s + np.uint64(i)
+            return acc
+
+        _compute_kernel = kernel
+    return _compute_kernel
+
 class SimpleHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 defaults to keep-alive, letting clients reuse one socket
+    # for the whole run instead of paying a TCP handshake per request.
+    protocol_version = "HTTP/1.1"
+
+    # Prebuilt status line + headers + body, sent as one write() so each
+    # response costs a single send syscall instead of four small ones
+    # (which also sidesteps delayed-ACK stalls on the loopback).
+    RESPONSE = (
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Length: 2\r\n"
+        b"Connection: keep-alive\r\n"
+        b"\r\n"
+        b"OK"
+    )
+
     def do_GET(self):
-        payload = b"OK"
-        self.send_response(200)
-        self.send_header("Content-Length", str(len(payload)))
-        self.end_headers()
-        self.wfile.write(payload)
+        self.wfile.write(self.RESPONSE)
 
     def log_message(self, fmt, *args):
         return
 
 def compute_test(iters=5_000_000):
     seed = 0x123456789ABCDEF0
-    acc = 0
+    try:
+        kernel = _load_compute_kernel()
+    except ImportError:
+        kernel = None
     start = time.perf_counter_ns()
-    for i in range(iters):
-        seed ^= (seed << 13) & 0xFFFFFFFFFFFFFFFF
-        seed ^= (seed >> 7)
-        seed ^= (seed << 17) & 0xFFFFFFFFFFFFFFFF
-        acc ^= seed + i
+    if kernel is not None:
+        # uint64 wraparound is native in the JIT kernel, so no masking needed.
+        acc = int(kernel(iters, seed))
+    else:
+        acc = 0
+        for i in range(iters):
+            seed ^= (seed << 13) & 0xFFFFFFFFFFFFFFFF
+            seed ^= (seed >> 7)
+            seed ^= (seed << 17) & 0xFFFFFFFFFFFFFFFF
+            acc ^= seed + i
     end = time.perf_counter_ns()
     return {
         "ops": iters,
@@ -37,17 +87,44 @@ def compute_test(iters=5_000_000):
     }
 
 def memory_test(size_bytes=64 * 1024 * 1024, passes=4):
+    try:
+        import numpy as np
+    except ImportError:
+        return _memory_test_py(size_bytes, passes)
+    a = np.zeros(size_bytes, dtype=np.uint8)
+    b = np.zeros(size_bytes, dtype=np.uint8)
+    a[::4096] = (np.arange(len(a[::4096])) & 0xFF).astype(np.uint8)
+    start = time.perf_counter_ns()
+    checksum = 0
+    for p in range(passes):
+        # One SIMD ufunc pass plus one reduction instead of per-byte
+        # Python dispatch; uint8 addition wraps just like the & 0xFF.
+        np.add(a, np.uint8(p & 0xFF), out=b)
+        checksum += int(b.sum(dtype=np.uint64))
+        a, b = b, a
+    end = time.perf_counter_ns()
+    return {
+        "bytes": size_bytes * passes,
+        "ns": end - start,
+        "checksum": checksum & 0xFFFFFFFFFFFFFFFF,
+    }
+
+def _memory_test_py(size_bytes, passes):
     a = bytearray(size_bytes)
-    b = bytearray(size_bytes)
     for i in range(0, size_bytes, 4096):
         a[i] = (i // 4096) & 0xFF
+    a = bytes(a)
     start = time.perf_counter_ns()
     checksum = 0
     for p in range(passes):
-        for i in range(size_bytes):
-            b[i] = (a[i] + p) & 0xFF
-            checksum += b[i]
-        a, b = b, a
+        # (x + p) & 0xFF as a 256-entry LUT: translate runs one
+        # branchless C loop over the whole buffer and hands back a fresh
+        # bytes object (one malloc per pass, no copy-back into a
+        # bytearray), and sum() is a single C reduction, so no per-byte
+        # work happens at the Python level.
+        table = bytes((x + p) & 0xFF for x in range(256))
+        a = a.translate(table)
+        checksum += sum(a)
     end = time.perf_counter_ns()
     return {
         "bytes": size_bytes * passes,
@@ -58,25 +135,28 @@ def memory_test(size_bytes=64 * 1024 * 1024, passes=4):
 def file_io_test(root, file_count=128, file_size=4096):
     os.makedirs(root, exist_ok=True)
     payload = bytes((i ^ 0x5A) & 0xFF for i in range(file_size))
+    # Materialize each path once instead of re-formatting it per op.
+    paths = [Path(root) / f"file{i:04d}" for i in range(file_count)]
     start = time.perf_counter_ns()
     ops = 0
     bytes_moved = 0
-    for i in range(file_count):
-        path = os.path.join(root, f"file{i:04d}")
-        with open(path, "wb") as f:
-            f.write(payload)
+    for path in paths:
+        # write_bytes/read_bytes skip BufferedIO entirely: one open, one
+        # full-file write/read, none of the isatty/lseek probe syscalls.
+        path.write_bytes(payload)
         ops += 1
         bytes_moved += file_size
-        with open(path, "rb") as f:
-            data = f.read()
+        data = path.read_bytes()
         ops += 1
         bytes_moved += len(data)
-        os.stat(path)
-        ops += 1
-    for i in range(file_count):
-        path = os.path.join(root, f"file{i:04d}")
-        os.unlink(path)
-        ops += 1
+    # One getdents64 enumerates every file at once; stat and unlink then
+    # reuse the scanned entries instead of re-resolving each path.
+    with os.scandir(root) as it:
+        for entry in it:
+            entry.stat(follow_symlinks=False)
+            ops += 1
+            os.unlink(entry.path)
+            ops += 1
     end = time.perf_counter_ns()
     return {
         "ops": ops,
@@ -84,9 +164,19 @@ def file_io_test(root, file_count=128, file_size=4096):
         "ns": end - start,
     }
 
+def _http_worker(port, count):
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    conn.connect()
+    total = 0
+    for _ in range(count):
+        conn.request("GET", "/")
+        total += len(conn.getresponse().read())
+    conn.close()
+    return total
+
 def http_loopback_test(requests=2000):
     try:
-        server = HTTPServer(("127.0.0.1", 0), SimpleHandler)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), SimpleHandler)
     except PermissionError as exc:
         return {
             "error": f"permission denied: {exc}",
@@ -94,20 +184,33 @@ def http_loopback_test(requests=2000):
     port = server.server_address[1]
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
+
+    # Phase 1: one keep-alive connection, serialized requests (latency).
     start = time.perf_counter_ns()
-    total = 0
-    for _ in range(requests):
-        sock = socket.create_connection(("127.0.0.1", port))
-        sock.sendall(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
-        data = sock.recv(1024)
-        total += len(data)
-        sock.close()
+    total = _http_worker(port, requests)
     end = time.perf_counter_ns()
+
+    # Phase 2: wrk-style threads x connections, each worker driving its
+    # own keep-alive connection, to measure saturated throughput.
+    workers = os.cpu_count() or 1
+    per_worker = max(requests // workers, 1)
+    c_start = time.perf_counter_ns()
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = [ex.submit(_http_worker, port, per_worker) for _ in range(workers)]
+        c_total = sum(f.result() for f in futures)
+    c_end = time.perf_counter_ns()
+
     server.shutdown()
     return {
         "requests": requests,
         "bytes": total,
         "ns": end - start,
+        "concurrent": {
+            "workers": workers,
+            "requests": per_worker * workers,
+            "bytes": c_total,
+            "ns": c_end - c_start,
+        },
     }
 
 def get_os_release():
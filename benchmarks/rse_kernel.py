@@ -1,117 +1,170 @@
-import random
 import time
 import csv
-import sys
 import os
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _step_kernel(xs, ys, zs, ages, width, height, depth,
+                     rand_vals, dxs, dys, dzs):
+        for i in prange(len(xs)):
+            ages[i] += 1
+            if rand_vals[i] > 0.8:
+                xs[i] = (xs[i] + dxs[i]) % width
+                ys[i] = (ys[i] + dys[i]) % height
+                zs[i] = (zs[i] + dzs[i]) % depth
+else:
+    _step_kernel = None
+
 # RSE Kernel - Python Port for Scientific Verification
 # Goals:
 # 1. Replicate logic outside V8/Node
 # 2. Verify O(1) memory scaling in a reference-counted language
+#
+# Agent state lives in Structure-of-Arrays form: one int32 array per
+# attribute instead of one Python object per agent. step() is then a
+# handful of vectorized ops with no per-agent interpreter dispatch and
+# no per-cycle snapshot allocation.
+
+class RSEKernel:
+    # Steps of random numbers drawn per generator call; amortizes the
+    # generator overhead from 4 calls per step to 2 calls per block.
+    RNG_BLOCK = 1024
 
-class SymbolicAgent:
-    def __init__(self, id, symbol):
-        self.id = id
-        self.symbol = symbol
-        self.x = 0
-        self.y = 0
-        self.z = 0
-        self.age = 0
-
-class ToroidalSpace:
-    def __init__(self, width=32, height=32, depth=32):
+    def __init__(self, width=32, height=32, depth=32, seed=None):
         self.width = width
         self.height = height
         self.depth = depth
-        self.grid = {} # Dict for sparse storage, similar to JS Map
+        self.cycle = 0
+        self.rng = np.random.default_rng(seed)
+        self._rand_vals = None
+        self._rand_moves = None
+        self._rand_pos = 0
+        self.ids = np.empty(0, dtype=np.int32)
+        self.symbols = np.empty(0, dtype=np.uint8)
+        self.xs = np.empty(0, dtype=np.int32)
+        self.ys = np.empty(0, dtype=np.int32)
+        self.zs = np.empty(0, dtype=np.int32)
+        self.ages = np.empty(0, dtype=np.int32)
 
-    def add_agent(self, agent):
-        self.grid[agent.id] = agent
+    def init(self, agent_count=50):
+        self.ids = np.arange(agent_count, dtype=np.int32)
+        self.symbols = (65 + self.rng.integers(0, 26, agent_count)).astype(np.uint8)
+        self.xs = self.rng.integers(0, self.width, agent_count, dtype=np.int32)
+        self.ys = self.rng.integers(0, self.height, agent_count, dtype=np.int32)
+        self.zs = self.rng.integers(0, self.depth, agent_count, dtype=np.int32)
+        self.ages = np.zeros(agent_count, dtype=np.int32)
+        self._rand_vals = None  # population changed; discard buffered draws
 
-    def move_agent(self, agent, dx, dy, dz):
-        agent.x = (agent.x + dx) % self.width
-        agent.y = (agent.y + dy) % self.height
-        agent.z = (agent.z + dz) % self.depth
-        # In a full physics engine, we'd update spatial partition here
+    @property
+    def agent_count(self):
+        return len(self.ids)
 
-class RSEKernel:
-    def __init__(self):
-        self.space = ToroidalSpace()
-        self.cycle = 0
-    
-    def init(self, agent_count=50):
-        for i in range(agent_count):
-            self.spawn_agent()
-
-    def spawn_agent(self):
-        uid = f"{random.randint(0, 100000000)}"
-        char = chr(65 + random.randint(0, 25))
-        agent = SymbolicAgent(uid, char)
-        agent.x = random.randint(0, self.space.width - 1)
-        agent.y = random.randint(0, self.space.height - 1)
-        agent.z = random.randint(0, self.space.depth - 1)
-        self.space.add_agent(agent)
+    def _refill_rand(self, n):
+        block = self.RNG_BLOCK
+        self._rand_vals = self.rng.random((block, n))
+        self._rand_moves = self.rng.integers(-1, 2, (block, 3, n), dtype=np.int32)
+        self._rand_pos = 0
 
     def step(self):
         self.cycle += 1
-        # Iterate over all agents
-        # In Python, list(dict.values()) creates a snapshot list, consuming Memory O(N) relative to agent count
-        # But relative to *Recursion Depth*, this is O(1) because N is constant.
-        agents = list(self.space.grid.values())
-        
-        for agent in agents:
-            agent.age += 1
-            if random.random() > 0.8:
-                dx = random.randint(-1, 1)
-                dy = random.randint(-1, 1)
-                dz = random.randint(-1, 1)
-                self.space.move_agent(agent, dx, dy, dz)
+        n = len(self.ids)
+        if self._rand_vals is None or self._rand_pos == self.RNG_BLOCK:
+            self._refill_rand(n)
+        rand_vals = self._rand_vals[self._rand_pos]
+        dx, dy, dz = self._rand_moves[self._rand_pos]
+        self._rand_pos += 1
+        if _step_kernel is not None:
+            # RNG stays in Python (bulk draws above); the scalar loop over
+            # agents runs as compiled code with no ufunc dispatch overhead.
+            _step_kernel(self.xs, self.ys, self.zs, self.ages,
+                         self.width, self.height, self.depth,
+                         rand_vals, dx, dy, dz)
+            return
+        self.ages += 1
+        mask = rand_vals > 0.8
+        # Toroidal wrap: % keeps coordinates in [0, dim) even for -1.
+        self.xs[mask] = (self.xs[mask] + dx[mask]) % self.width
+        self.ys[mask] = (self.ys[mask] + dy[mask]) % self.height
+        self.zs[mask] = (self.zs[mask] + dz[mask]) % self.depth
+
+def _make_rss_reader():
+    # Reading /proc/self/statm is one small read per sample, ~10x cheaper
+    # than psutil's memory_info(). Fall back to psutil off Linux.
+    try:
+        page_kb = os.sysconf("SC_PAGE_SIZE") / 1024
+        with open("/proc/self/statm") as f:
+            f.read()
+
+        def read_rss():
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * page_kb / 1024
+        return read_rss
+    except (OSError, ValueError):
+        pass
+    try:
+        import psutil
+        process = psutil.Process(os.getpid())
+        return lambda: process.memory_info().rss / 1024 / 1024
+    except ImportError:
+        return None
 
 def run_telemetry():
     print("=================================================")
     print("   RSE KERNEL // PYTHON 3 // REFERENCE PORT      ")
     print("=================================================")
-    
+
     kernel = RSEKernel()
     kernel.init(50) # Same 50 agents as JS default
-    
+
+    if _step_kernel is not None:
+        # Warm the JIT on a throwaway kernel so compile time (seconds on
+        # a cold cache) does not pollute the first telemetry samples.
+        warmup = RSEKernel(seed=0)
+        warmup.init(1)
+        warmup.step()
+
     TOTAL_STEPS = 50000
     SAMPLE_RATE = 10
     LOG_FILE = "rse_py_telemetry.csv"
-    
+
     print(f"[SETUP] Logging to {LOG_FILE}")
     print(f"[RUN] Executing {TOTAL_STEPS} steps...")
-    
-    # Try getting memory module
-    process = None
-    try:
-        import psutil
-        process = psutil.Process(os.getpid())
-    except ImportError:
-        print("[WARN] 'psutil' not found. Memory logging will be approximate or skipped.")
 
-    with open(LOG_FILE, 'w', newline='') as f:
+    read_rss = _make_rss_reader()
+    if read_rss is None:
+        print("[WARN] No RSS source (no /proc, no 'psutil'). Memory logging skipped.")
+
+    # Buffer samples in memory and bulk-write at the end so logging IO
+    # never lands inside a measured TimeDelta.
+    rows = []
+    start_time = time.time()
+    last_time = start_time
+
+    for step in range(1, TOTAL_STEPS + 1):
+        kernel.step()
+
+        if step % SAMPLE_RATE == 0:
+            now = time.time()
+            rss_mb = read_rss() if read_rss else 0
+
+            dt = (now - last_time) * 1000
+            rows.append((step, f"{rss_mb:.4f}", f"{dt:.4f}"))
+            last_time = now
+
+        if step % 5000 == 0:
+            print(f"    > Progress: {step}/{TOTAL_STEPS}")
+
+    with open(LOG_FILE, 'w', newline='', buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(["Step", "RSS_MB", "TimeDelta_ms"])
-        
-        start_time = time.time()
-        last_time = start_time
-        
-        for step in range(1, TOTAL_STEPS + 1):
-            kernel.step()
-            
-            if step % SAMPLE_RATE == 0:
-                now = time.time()
-                rss_mb = 0
-                if process:
-                    rss_mb = process.memory_info().rss / 1024 / 1024
-                
-                dt = (now - last_time) * 1000
-                writer.writerow([step, f"{rss_mb:.4f}", f"{dt:.4f}"])
-                last_time = now
-            
-            if step % 5000 == 0:
-                print(f"    > Progress: {step}/{TOTAL_STEPS}")
+        writer.writerows(rows)
 
     print("[DONE] Execution Complete.")
 
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""One-shot source fixups for the grey_compiler crates.
+
+Consolidates the old fix_issues / fix_issues_simple / fix_issues_v2
+scripts: each touched file is read once, gets every edit applied
+in-memory, and is written back once. Patterns are compiled at module
+load, and edits are idempotent so re-running is safe.
+"""
+import re
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+# path (relative to grey_compiler/) -> ordered (pattern, replacement)
+# edits. Plain-str patterns are applied with str.replace (one fast C
+# scan, no regex engine); compiled patterns are kept only where the
+# match genuinely varies, like the brace contents of the import lines.
+EDITS = {
+    "crates/grey_lang/src/types.rs": [
+        ("self.convert_ast_type(param.param_type)?;",
+         "self.convert_ast_type(&param.param_type)?;"),
+        (re.compile(r"^use crate::diagnostics::\{[^}]*\};\n", re.M), ""),
+    ],
+    "crates/grey_lang/src/lib.rs": [
+        (re.compile(r"^use crate::diagnostics::\{[^}]*\};\n", re.M), ""),
+    ],
+    "crates/grey_lang/src/lexer.rs": [
+        (re.compile(r"^use crate::diagnostics::\{[^}]*\};\n", re.M), ""),
+    ],
+}
+
+def apply_edits():
+    for rel_path, edits in EDITS.items():
+        path = ROOT / rel_path
+        if not path.exists():
+            print(f"[skip] {rel_path} (not present)")
+            continue
+        text = path.read_text(encoding="utf-8")
+        fixed = text
+        for pattern, replacement in edits:
+            if isinstance(pattern, str):
+                fixed = fixed.replace(pattern, replacement)
+            else:
+                fixed = pattern.sub(replacement, fixed)
+        if fixed != text:
+            path.write_text(fixed, encoding="utf-8")
+            print(f"[fixed] {rel_path}")
+        else:
+            print(f"[clean] {rel_path}")
+
+if __name__ == "__main__":
+    apply_edits()
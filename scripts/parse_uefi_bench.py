@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Parse UEFI kernel benchmark numbers out of a QEMU serial log.
+
+Reads benchmarks/uefi_serial.log (or --log), appends one row per run to
+benchmarks/uefi_bench.csv and rewrites benchmarks/uefi_bench.json with
+the latest values. Later occurrences win, matching the serial stream
+where the final torus re-reports init workloads.
+"""
+import argparse
+import json
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent.parent / "benchmarks"
+
+PATTERNS = {
+    "init_compute": re.compile(r"\[init\] compute ops=(\d+) cycles=(\d+) checksum=(\d+)"),
+    "init_memfs": re.compile(r"\[init\] memfs ops=(\d+) bytes=(\d+) cycles=(\d+)"),
+    "init_blk0": re.compile(r"\[init\] /dev/blk0 size=(\d+) ops=(\d+) bytes=(\d+) mismatches=(\d+) cycles=(\d+)"),
+    "init_loop": re.compile(r"\[init\] loopback wrote=(\d+) read=(\d+)"),
+    "init_net": re.compile(r"\[init\] net0 wrote=(\d+) read=(\d+)"),
+    "k_compute": re.compile(r"\[RSE\] compute ops=(\d+) cycles=(\d+) cycles/op=(\d+) checksum=(\d+)"),
+    "k_memory": re.compile(r"\[RSE\] memory bytes=(\d+) cycles=(\d+) cycles/byte=(\d+)"),
+    "k_ramfs": re.compile(r"\[RSE\] ramfs ops=(\d+) cycles=(\d+) cycles/op=(\d+) checksum=(\d+) files=(\d+)"),
+    "k_uefi_fs": re.compile(r"\[RSE\] UEFI FS ops=(\d+) cycles=(\d+) cycles/op=(\d+) checksum=(\d+)"),
+    "k_uefi_blk": re.compile(r"\[RSE\] UEFI block bytes=(\d+) write cycles=(\d+) write cycles/byte=(\d+) read cycles=(\d+) read cycles/byte=(\d+) checksum=(\d+)"),
+    "k_http": re.compile(r"\[RSE\] http requests=(\d+) cycles=(\d+) cycles/req=(\d+) checksum=(\d+)"),
+}
+
+# Dispatch on the fixed line prefix so each log line is tested against at
+# most one pattern instead of all eleven; the "... benchmark start"
+# banner lines simply never dispatch.
+PREFIX_DISPATCH = [
+    ("[init] compute ", "init_compute"),
+    ("[init] memfs ", "init_memfs"),
+    ("[init] /dev/blk0 ", "init_blk0"),
+    ("[init] loopback wrote", "init_loop"),
+    ("[init] net0 wrote", "init_net"),
+    ("[RSE] compute ops", "k_compute"),
+    ("[RSE] memory bytes", "k_memory"),
+    ("[RSE] ramfs ops", "k_ramfs"),
+    ("[RSE] UEFI FS ops", "k_uefi_fs"),
+    ("[RSE] UEFI block bytes", "k_uefi_blk"),
+    ("[RSE] http requests", "k_http"),
+]
+
+CSV_COLUMNS = ["timestamp"]
+for _key, _rx in PATTERNS.items():
+    CSV_COLUMNS += [f"{_key}_{_i}" for _i in range(_rx.groups)]
+CSV_COLUMNS.append("virtio_blk_status")
+
+def parse_log(path):
+    data = {}
+    virtio_blk_status = "timeout"
+    # Stream line by line (64 KiB buffer) instead of materializing the
+    # whole log as a str plus a list; boot logs can run to many MB.
+    with open(path, "r", encoding="utf-8", errors="ignore", buffering=1 << 16) as f:
+        for line in f:
+            line = line.strip()
+            if not line.startswith(("[init]", "[RSE]")):
+                continue
+            if line.startswith("[RSE] virtio-blk bytes="):
+                virtio_blk_status = "ok"
+                continue
+            for prefix, key in PREFIX_DISPATCH:
+                if line.startswith(prefix):
+                    m = PATTERNS[key].match(line)
+                    if m:
+                        data[key] = [int(x) for x in m.groups()]
+                    break
+    return data, virtio_blk_status
+
+def write_csv(path, row):
+    header = ",".join(CSV_COLUMNS)
+    # Check the header with a single readline rather than loading the
+    # whole file; the file itself grows append-only, O(1) per run.
+    if path.exists() and path.stat().st_size:
+        with path.open("rb") as f:
+            first = f.readline().rstrip(b"\r\n")
+        if first != header.encode("utf-8"):
+            print(f"[warn] {path.name} header drift; appending anyway")
+    with path.open("a", encoding="utf-8", buffering=1 << 16) as f:
+        if f.tell() == 0:
+            f.write(header + "\n")
+        f.write(",".join(str(v) for v in row) + "\n")
+
+def write_json(path, timestamp, data):
+    doc = {"timestamp": timestamp}
+    doc.update(data)
+    path.write_text(json.dumps(doc, indent=2) + "\n", encoding="utf-8")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--log", default=str(BENCH_DIR / "uefi_serial.log"))
+    parser.add_argument("--csv", default=str(BENCH_DIR / "uefi_bench.csv"))
+    parser.add_argument("--json", default=str(BENCH_DIR / "uefi_bench.json"))
+    args = parser.parse_args()
+
+    data, virtio_blk_status = parse_log(args.log)
+    missing = [key for key in PATTERNS if key not in data]
+    if missing:
+        print(f"[warn] no match for: {', '.join(missing)}")
+
+    timestamp = datetime.now(timezone.utc).isoformat()
+    row = [timestamp]
+    for key, rx in PATTERNS.items():
+        row += data.get(key, [""] * rx.groups)
+    row.append(virtio_blk_status)
+    write_csv(Path(args.csv), row)
+    write_json(Path(args.json), timestamp, data)
+    print(f"[done] {len(data)}/{len(PATTERNS)} benchmarks parsed")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Refresh the UEFI benchmark bullets in PROJECT_STATUS.md.
+
+Averages the last three runs recorded in benchmarks/uefi_bench.csv and
+rewrites the seven bullets of the "UEFI Kernel Benchmarks" section. The
+status file is read once and all bullets are replaced in a single
+combined-regex pass, then written back in place.
+"""
+import csv
+import re
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+STATUS_PATH = ROOT / "PROJECT_STATUS.md"
+CSV_PATH = ROOT / "benchmarks" / "uefi_bench.csv"
+RUNS = 3
+
+def load_stats(path, runs=RUNS):
+    with path.open(encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))[-runs:]
+    stats = {}
+    for row in rows:
+        for col, value in row.items():
+            if value and value.isdigit():
+                stats.setdefault(col, []).append(int(value))
+    return {col: sum(vals) // len(vals) for col, vals in stats.items()}
+
+def _fmt_compute(s):
+    return (f"- **Compute**: {s['k_compute_0']:,} ops, {s['k_compute_1']:,} cycles "
+            f"({s['k_compute_2']:,} cycles/op)")
+
+def _fmt_memory(s):
+    return (f"- **Memory**: {s['k_memory_0']:,} bytes, {s['k_memory_1']:,} cycles "
+            f"({s['k_memory_2']:,} cycles/byte)")
+
+def _fmt_ramfs(s):
+    return (f"- **RAMFS File I/O**: {s['k_ramfs_0']:,} ops, {s['k_ramfs_1']:,} cycles "
+            f"({s['k_ramfs_2']:,} cycles/op)")
+
+def _fmt_uefi_fs(s):
+    return (f"- **UEFI FAT File I/O (USB disk)**: {s['k_uefi_fs_0']:,} ops, "
+            f"{s['k_uefi_fs_1']:,} cycles ({s['k_uefi_fs_2']:,} cycles/op)")
+
+def _fmt_uefi_blk(s):
+    return (f"- **UEFI Raw Block I/O (USB disk)**: {s['k_uefi_blk_0']:,} bytes, "
+            f"write {s['k_uefi_blk_1']:,} cycles ({s['k_uefi_blk_2']:,} cycles/byte), "
+            f"read {s['k_uefi_blk_3']:,} cycles ({s['k_uefi_blk_4']:,} cycles/byte)")
+
+def _fmt_http(s):
+    return (f"- **HTTP Loopback**: {s['k_http_0']:,} requests, {s['k_http_1']:,} cycles "
+            f"({s['k_http_2']:,} cycles/req)")
+
+def _fmt_init_smoke(s):
+    return (f"- **Init Device Smoke Tests**: /dev/blk0 ({s['init_blk0_0']}B, "
+            f"{s['init_blk0_1']} ops, {s['init_blk0_2']:,} bytes, "
+            f"{s['init_blk0_3']} mismatches, {s['init_blk0_4']:,} cycles), "
+            f"/dev/loopback ({s['init_loop_0']}B echo, {s['init_loop_1']}B read), "
+            f"/dev/net0 ({s['init_net_0']:,}B tx, {s['init_net_1']:,}B rx)")
+
+# Patterns are shape-specific (ops/cycles counts, not just the bold
+# label) so the Compute/Memory bullets in the Linux baseline section
+# never match. One combined alternation keeps the whole update to a
+# single linear pass over the file.
+REPLACERS = [
+    (r"^- \*\*Compute\*\*: [\d,]+ ops, [\d,]+ cycles \([\d,]+ cycles/op\)$", _fmt_compute),
+    (r"^- \*\*Memory\*\*: [\d,]+ bytes, [\d,]+ cycles \([\d,]+ cycles/byte\)$", _fmt_memory),
+    (r"^- \*\*RAMFS File I/O\*\*: .+$", _fmt_ramfs),
+    (r"^- \*\*UEFI FAT File I/O \(USB disk\)\*\*: .+$", _fmt_uefi_fs),
+    (r"^- \*\*UEFI Raw Block I/O \(USB disk\)\*\*: .+$", _fmt_uefi_blk),
+    (r"^- \*\*HTTP Loopback\*\*: [\d,]+ requests, .+$", _fmt_http),
+    (r"^- \*\*Init Device Smoke Tests\*\*: .+$", _fmt_init_smoke),
+]
+
+COMBINED = re.compile(
+    "|".join(f"(?P<g{i}>{pattern})" for i, (pattern, _fmt) in enumerate(REPLACERS)),
+    re.M,
+)
+
+def update_status(text, stats):
+    def replace(m):
+        _pattern, fmt = REPLACERS[int(m.lastgroup[1:])]
+        try:
+            return fmt(stats)
+        except KeyError:
+            return m.group(0)  # benchmark missing from recent runs; keep old line
+    return COMBINED.subn(replace, text)
+
+def main():
+    stats = load_stats(CSV_PATH)
+    with STATUS_PATH.open("r+", encoding="utf-8", buffering=1 << 16) as f:
+        text = f.read()
+        updated, count = update_status(text, stats)
+        if count != len(REPLACERS):
+            print(f"[warn] matched {count}/{len(REPLACERS)} status bullets")
+        if updated != text:
+            f.seek(0)
+            f.write(updated)
+            f.truncate()
+            print(f"[done] updated {STATUS_PATH.name} from last {RUNS} runs")
+        else:
+            print("[done] status already current")
+
+if __name__ == "__main__":
+    main()